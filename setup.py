@@ -12,5 +12,5 @@ setup(
     author_email="samstar2809@gmail.com",
     description="A Research and Preparation agent for job searching and application materials",
     keywords="job search, resume, cover letter, automation",
-    python_requires=">=3.8",
+    python_requires=">=3.10",
 )
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Entry point for the Research and Preparation Agent."""
 
 import sys
-import argparse
 from research_prep_agent.config.config_manager import config_manager
 
 
 def main():
     """Main entry point for the Research and Preparation Agent."""
+    # Imported here so that importing the package pays no argparse cost
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Research and Preparation Agent for job searching and application materials"
     )
@@ -35,7 +37,7 @@ def main():
     
     # Initialize configuration
     if args.config:
-        config_manager.__init__(args.config)
+        config_manager.reload(args.config)
     
     # Print welcome message
     print("Research and Preparation Agent")
@@ -1,8 +1,165 @@
 """Configuration management for the Research and Preparation Agent."""
 
+import copy
+import json
 import os
-import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Buffer size for config file I/O; larger than the 8 KiB default to cut
+# down on read/write syscalls.
+_IO_BUFFER_SIZE = 131072
+
+# Template for freshly created configurations. Built once at import time;
+# _create_default_config deep-copies it so instances never share state.
+_DEFAULT_CONFIG_TEMPLATE = {
+    "user_profile": {
+        "name": "Sam",
+        "email": "samstar2809@gmail.com",
+        "phone": "9715665066",
+        "location": "Chennai, TamilNadu",
+        "education": [
+            {
+                "degree": "Bachelor's Degree",
+                "field": "Computer Science",
+                "institution": "SRM University",
+                "year": 2020
+            }
+        ],
+        "skills": [
+            "Python", "Data Analysis", "Machine Learning"
+        ],
+        "experience": [
+            {
+                "title": "Software Developer",
+                "company": "Zoho",
+                "start_date": "2020-01",
+                "end_date": "2023-01",
+                "description": "Developed and maintained applications..."
+            }
+        ]
+    },
+    "job_search": {
+        "keywords": ["software developer", "python developer"],
+        "locations": ["Remote", "New York, NY"],
+        "exclude_keywords": ["senior", "lead"],
+        "job_boards": ["linkedin", "indeed"],
+        "refresh_interval_hours": 24
+    },
+    "credentials": {
+        "linkedin": {
+            "username": "",
+            "password": ""
+        },
+        "indeed": {
+            "api_key": ""
+        },
+        "openai": {
+            "api_key": ""
+        }
+    },
+    "output": {
+        "resume_template": "modern",
+        "cover_letter_template": "professional",
+        "output_directory": "~/Documents/JobApplications"
+    }
+}
+
+def _yaml() -> Tuple[Any, Any, Any]:
+    """Import PyYAML on demand and pick the fastest loader/dumper.
+
+    PyYAML (and LibYAML, via CSafeLoader) is deliberately not imported at
+    module level so that code paths which never touch YAML — warm starts
+    served from the JSON sidecar, or CLI runs that never read config —
+    skip its import cost entirely. After the first call the imports are
+    satisfied from sys.modules and effectively free.
+
+    Returns:
+        Tuple of (yaml module, loader class, dumper class), preferring
+        LibYAML's C implementations and falling back to pure Python.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+# Schema for the config structure, mirroring _DEFAULT_CONFIG_TEMPLATE.
+# Compiled once at import time into a plain-Python validator function,
+# which is far faster than interpreting the schema on every check.
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "user_profile": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "email": {"type": "string"},
+                "phone": {"type": "string"},
+                "location": {"type": "string"},
+                "education": {"type": "array", "items": {"type": "object"}},
+                "skills": {"type": "array", "items": {"type": "string"}},
+                "experience": {"type": "array", "items": {"type": "object"}},
+            },
+        },
+        "job_search": {
+            "type": "object",
+            "properties": {
+                "keywords": {"type": "array", "items": {"type": "string"}},
+                "locations": {"type": "array", "items": {"type": "string"}},
+                "exclude_keywords": {"type": "array", "items": {"type": "string"}},
+                "job_boards": {"type": "array", "items": {"type": "string"}},
+                "refresh_interval_hours": {"type": "number"},
+            },
+        },
+        "credentials": {
+            "type": "object",
+            "additionalProperties": {"type": "object"},
+        },
+        "output": {
+            "type": "object",
+            "properties": {
+                "resume_template": {"type": "string"},
+                "cover_letter_template": {"type": "string"},
+                "output_directory": {"type": "string"},
+            },
+        },
+    },
+}
+
+# fastjsonschema is optional; without it configs are simply not validated.
+try:
+    import fastjsonschema
+
+    _validate_config = fastjsonschema.compile(_CONFIG_SCHEMA)
+    _JsonSchemaException = fastjsonschema.JsonSchemaException
+except ImportError:
+    _validate_config = None
+
+
+class ConfigError(ValueError):
+    """Raised when the configuration does not match the expected schema."""
+
+
+def _check_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a config dict against the schema, if a validator is available.
+
+    Args:
+        config: Dictionary containing configuration values.
+
+    Returns:
+        The same dictionary, for call-site convenience.
+
+    Raises:
+        ConfigError: If the configuration is invalid.
+    """
+    if _validate_config is not None:
+        try:
+            _validate_config(config)
+        except _JsonSchemaException as exc:
+            raise ConfigError(f"Invalid configuration: {exc}") from exc
+    return config
 
 
 class ConfigManager:
@@ -18,18 +175,50 @@ class ConfigManager:
             os.path.expanduser("~"), ".research_prep_agent", "config.yaml"
         )
         self.config = self._load_config()
-        
+        self._rebuild_section_cache()
+
+    def _rebuild_section_cache(self) -> None:
+        """Cache references to the top-level config sections.
+
+        Lets the getters hand back a stored reference instead of doing a
+        dict lookup (and allocating a fresh empty-dict default) per call.
+        """
+        self._user_profile = self.config.get("user_profile", {})
+        self._job_search = self.config.get("job_search", {})
+        self._credentials = self.config.get("credentials", {})
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file.
         
         Returns:
             Dictionary containing configuration values.
         """
-        if not os.path.exists(self.config_path):
+        # Open directly and handle the missing-file case, rather than a
+        # separate exists() check: one syscall instead of stat-then-open.
+        # Binary mode lets LibYAML scan raw bytes without a text-decode pass.
+        try:
+            f = open(self.config_path, "rb", buffering=_IO_BUFFER_SIZE)
+        except FileNotFoundError:
             return self._create_default_config()
-            
-        with open(self.config_path, "r") as f:
-            return yaml.safe_load(f)
+
+        with f:
+            # A JSON sidecar is written alongside the YAML on every save.
+            # If it is still newer than the YAML, the config is unchanged
+            # and we can skip YAML parsing entirely (json is a much faster
+            # C extension). The YAML mtime comes from fstat on the already
+            # open descriptor, avoiding another path lookup.
+            cache_path = self.config_path + ".cache.json"
+            try:
+                if os.stat(cache_path).st_mtime >= os.fstat(f.fileno()).st_mtime:
+                    with open(cache_path, "rb") as cache_file:
+                        return _check_config(json.load(cache_file))
+            except (OSError, ValueError):
+                pass
+
+            yaml, loader, _ = _yaml()
+            config = _check_config(yaml.load(f, Loader=loader))
+        self._write_cache(config)
+        return config
             
     def _create_default_config(self) -> Dict[str, Any]:
         """Create a default configuration.
@@ -39,66 +228,27 @@ class ConfigManager:
         """
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-        
-        default_config = {
-            "user_profile": {
-                "name": "Sam",
-                "email": "samstar2809@gmail.com",
-                "phone": "9715665066",
-                "location": "Chennai, TamilNadu",
-                "education": [
-                    {
-                        "degree": "Bachelor's Degree",
-                        "field": "Computer Science",
-                        "institution": "SRM University",
-                        "year": 2020
-                    }
-                ],
-                "skills": [
-                    "Python", "Data Analysis", "Machine Learning"
-                ],
-                "experience": [
-                    {
-                        "title": "Software Developer",
-                        "company": "Zoho",
-                        "start_date": "2020-01",
-                        "end_date": "2023-01",
-                        "description": "Developed and maintained applications..."
-                    }
-                ]
-            },
-            "job_search": {
-                "keywords": ["software developer", "python developer"],
-                "locations": ["Remote", "New York, NY"],
-                "exclude_keywords": ["senior", "lead"],
-                "job_boards": ["linkedin", "indeed"],
-                "refresh_interval_hours": 24
-            },
-            "credentials": {
-                "linkedin": {
-                    "username": "",
-                    "password": ""
-                },
-                "indeed": {
-                    "api_key": ""
-                },
-                "openai": {
-                    "api_key": ""
-                }
-            },
-            "output": {
-                "resume_template": "modern",
-                "cover_letter_template": "professional",
-                "output_directory": "~/Documents/JobApplications"
-            }
-        }
-        
+
+        default_config = copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+
         # Save default config
-        with open(self.config_path, "w") as f:
-            yaml.dump(default_config, f, default_flow_style=False)
-            
+        self._write_yaml(default_config)
+        self._write_cache(default_config)
+
         return default_config
         
+    def reload(self, config_path: Optional[str] = None) -> None:
+        """Reload the configuration, optionally from a different file.
+
+        Args:
+            config_path: New path to the configuration file. If None, the
+                current path is re-read.
+        """
+        if config_path:
+            self.config_path = config_path
+        self.config = self._load_config()
+        self._rebuild_section_cache()
+
     def get_config(self) -> Dict[str, Any]:
         """Get the full configuration.
         
@@ -113,7 +263,7 @@ class ConfigManager:
         Returns:
             Dictionary containing user profile.
         """
-        return self.config.get("user_profile", {})
+        return self._user_profile
         
     def get_job_search_config(self) -> Dict[str, Any]:
         """Get the job search configuration.
@@ -121,7 +271,7 @@ class ConfigManager:
         Returns:
             Dictionary containing job search settings.
         """
-        return self.config.get("job_search", {})
+        return self._job_search
         
     def get_credentials(self, service: str) -> Dict[str, str]:
         """Get credentials for a specific service.
@@ -132,22 +282,85 @@ class ConfigManager:
         Returns:
             Dictionary containing credentials for the service.
         """
-        return self.config.get("credentials", {}).get(service, {})
+        return self._credentials.get(service, {})
         
     def update_config(self, config: Dict[str, Any]) -> None:
         """Update the configuration.
         
         Args:
             config: Dictionary containing new configuration values.
+
+        Raises:
+            ConfigError: If the updated configuration is invalid.
         """
         self.config.update(config)
+        _check_config(self.config)
+        self._rebuild_section_cache()
         self._save_config()
         
     def _save_config(self) -> None:
         """Save the configuration to file."""
-        with open(self.config_path, "w") as f:
-            yaml.dump(self.config, f, default_flow_style=False)
+        self._write_yaml(self.config)
+        self._write_cache(self.config)
+
+    def _write_yaml(self, config: Dict[str, Any]) -> None:
+        """Atomically write a config dict as YAML to the config path.
+
+        Writes to a temp file and renames it into place, so a crash
+        mid-write can never leave a truncated config behind (which would
+        silently be replaced by the defaults on the next load).
+
+        Args:
+            config: Dictionary containing configuration values.
+        """
+        yaml, _, dumper = _yaml()
+        tmp_path = self.config_path + ".tmp"
+        with open(tmp_path, "w", buffering=_IO_BUFFER_SIZE) as f:
+            yaml.dump(config, f, Dumper=dumper, default_flow_style=False)
+        os.replace(tmp_path, self.config_path)
+
+    def _write_cache(self, config: Dict[str, Any]) -> None:
+        """Write the JSON sidecar used to skip YAML parsing on warm starts.
+
+        The cache is best-effort; the YAML file remains the source of truth.
+        Written with the same temp-file-and-rename pattern as the YAML.
+
+        Args:
+            config: Dictionary containing configuration values.
+        """
+        cache_path = self.config_path + ".cache.json"
+        tmp_path = cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(config, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError):
+            pass
+
+
+class _LazyConfig:
+    """Lazy proxy around the ConfigManager singleton.
+
+    Defers construction (and therefore config file I/O) until the first
+    attribute access, so importing this module stays cheap for code paths
+    that never touch the configuration.
+    """
+
+    def __init__(self):
+        self._inst: Optional[ConfigManager] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._inst is None:
+            self._inst = ConfigManager()
+        return getattr(self._inst, name)
+
+    def reload(self, config_path: Optional[str] = None) -> None:
+        """Reload the configuration, constructing the manager if needed."""
+        if self._inst is None:
+            self._inst = ConfigManager(config_path)
+        else:
+            self._inst.reload(config_path)
 
 
-# Create a singleton instance
-config_manager = ConfigManager()
\ No newline at end of file
+# Singleton instance; the underlying ConfigManager is created on first use
+config_manager = _LazyConfig()
\ No newline at end of file
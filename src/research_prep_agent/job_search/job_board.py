@@ -2,15 +2,25 @@
 Job board interface module for the Research and Preparation agent.
 Provides abstract and concrete implementations for different job boards.
 """
+import asyncio
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from dataclasses import dataclass, replace
 from datetime import datetime
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class JobPosting:
-    """Data class to represent a job posting."""
+    """Immutable data class to represent a job posting.
+
+    Slots keep per-instance memory down and speed up attribute access,
+    which matters once search results scale to thousands of postings.
+    """
     id: str
     title: str
     company: str
@@ -25,6 +35,58 @@ class JobPosting:
     raw_data: Optional[Dict] = None  # Store the original raw data for reference
 
 
+# Mock postings returned by the stub implementations below, built once at
+# import time. JobPosting is frozen, so the shared instances are safe to
+# return directly; this skips the dataclass __init__ (and a datetime.now()
+# call) on every mock search.
+_MOCK_DATE = datetime.now()
+
+_LINKEDIN_MOCK = JobPosting(
+    id="linkedin-job-123",
+    title="Senior Software Engineer",
+    company="Tech Company Inc.",
+    location="San Francisco, CA",
+    description="We're looking for a senior software engineer...",
+    url="https://linkedin.com/jobs/view/123",
+    date_posted=_MOCK_DATE,
+    salary_info="$120,000 - $150,000",
+    job_type="full-time",
+    requirements=["Python", "AWS", "5+ years experience"],
+    is_remote=True,
+    raw_data={"original_data": "would be here"}
+)
+
+_INDEED_MOCK = JobPosting(
+    id="indeed-job-456",
+    title="Python Developer",
+    company="Software Solutions LLC",
+    location="New York, NY",
+    description="Looking for a Python developer with web experience...",
+    url="https://indeed.com/jobs/view/456",
+    date_posted=_MOCK_DATE,
+    salary_info="$90,000 - $110,000",
+    job_type="full-time",
+    requirements=["Python", "Django", "3+ years experience"],
+    is_remote=False,
+    raw_data={"original_data": "would be here"}
+)
+
+_GLASSDOOR_MOCK = JobPosting(
+    id="glassdoor-job-789",
+    title="Frontend Developer",
+    company="WebUI Technologies",
+    location="Austin, TX",
+    description="Seeking a skilled frontend developer...",
+    url="https://glassdoor.com/jobs/view/789",
+    date_posted=_MOCK_DATE,
+    salary_info="$85,000 - $105,000",
+    job_type="full-time",
+    requirements=["JavaScript", "React", "2+ years experience"],
+    is_remote=True,
+    raw_data={"original_data": "would be here"}
+)
+
+
 class JobBoardInterface(ABC):
     """Abstract base class for job board interfaces."""
     
@@ -56,19 +118,111 @@ class JobBoardInterface(ABC):
         """
         pass
     
+    async def search_async(self,
+                           keywords: List[str],
+                           location: Optional[str] = None,
+                           radius: Optional[int] = None,
+                           job_type: Optional[List[str]] = None,
+                           remote: bool = False,
+                           experience_level: Optional[List[str]] = None,
+                           posted_within_days: Optional[int] = None,
+                           limit: int = 50) -> List[JobPosting]:
+        """
+        Asynchronous variant of search(), taking the same parameters.
+
+        The default implementation runs the synchronous search() in a
+        worker thread so that several boards can be queried concurrently
+        (see MultiBoardSearcher). Boards backed by an async HTTP client
+        should override this with a native coroutine.
+
+        Returns:
+            List of JobPosting objects matching the search criteria
+        """
+        return await asyncio.to_thread(
+            self.search,
+            keywords,
+            location=location,
+            radius=radius,
+            job_type=job_type,
+            remote=remote,
+            experience_level=experience_level,
+            posted_within_days=posted_within_days,
+            limit=limit,
+        )
+
+    def search_frame(self,
+                     keywords: List[str],
+                     location: Optional[str] = None,
+                     radius: Optional[int] = None,
+                     job_type: Optional[List[str]] = None,
+                     remote: bool = False,
+                     experience_level: Optional[List[str]] = None,
+                     posted_within_days: Optional[int] = None,
+                     limit: int = 50) -> "pd.DataFrame":
+        """
+        Search for jobs and return the results as a columnar DataFrame.
+
+        Takes the same parameters as search(). The columnar layout lets
+        downstream analysis filter thousands of postings with vectorized
+        operations (e.g. df[df.is_remote]) instead of Python loops over
+        JobPosting objects.
+
+        Returns:
+            A pandas DataFrame with one column per JobPosting field and
+            date_posted as a datetime64[ns] column
+        """
+        import pandas as pd
+
+        postings = self.search(
+            keywords,
+            location=location,
+            radius=radius,
+            job_type=job_type,
+            remote=remote,
+            experience_level=experience_level,
+            posted_within_days=posted_within_days,
+            limit=limit,
+        )
+        columns: Dict[str, list] = {
+            field: [getattr(p, field) for p in postings]
+            for field in ("id", "title", "company", "location", "description",
+                          "url", "date_posted", "salary_info", "job_type",
+                          "requirements", "is_remote", "raw_data")
+        }
+        frame = pd.DataFrame(columns)
+        frame["date_posted"] = pd.to_datetime(frame["date_posted"])
+        return frame
+
     @abstractmethod
-    def get_job_details(self, job_id: str) -> JobPosting:
+    def get_job_details(self, job_id: str,
+                        _now: Optional[datetime] = None) -> JobPosting:
         """
         Get detailed information about a specific job.
-        
+
         Args:
             job_id: The unique identifier for the job
-            
+            _now: Optional fetch timestamp; callers looping over many jobs
+                can capture datetime.now() once and pass it to every call
+                instead of paying for a fresh clock read per posting
+
         Returns:
             A JobPosting object with detailed information
         """
         pass
     
+    def _throttle(self) -> None:
+        """
+        Sleep as needed to honor the board's minimum request interval.
+
+        Uses time.monotonic_ns() so the bookkeeping is integer arithmetic
+        and immune to wall-clock steps (DST, NTP). Real implementations
+        should call this before every outbound request.
+        """
+        wait_ns = self._last_request_ns + self._min_interval_ns - time.monotonic_ns()
+        if wait_ns > 0:
+            time.sleep(wait_ns / 1e9)
+        self._last_request_ns = time.monotonic_ns()
+
     @abstractmethod
     def is_rate_limited(self) -> bool:
         """
@@ -98,8 +252,8 @@ class LinkedInJobBoard(JobBoardInterface):
         """
         self._api_key = api_key
         self._rate_limited = False
-        self._last_request_time = None
-        self._min_request_interval = 1.0  # seconds between requests
+        self._last_request_ns = 0
+        self._min_interval_ns = int(1.0 * 1e9)  # nanoseconds between requests
     
     @property
     def name(self) -> str:
@@ -120,47 +274,21 @@ class LinkedInJobBoard(JobBoardInterface):
         For now, this uses a mock implementation. The actual implementation
         would use the LinkedIn API or web scraping.
         """
-        # In a real implementation, this would make an API call or scrape the website
-        # For now, we'll return a mock result for testing purposes
-        mock_results = []
-        
-        # Create some mock job postings for testing
-        # In a real implementation, these would be created from API/scraped data
-        mock_job = JobPosting(
-            id="linkedin-job-123",
-            title="Senior Software Engineer",
-            company="Tech Company Inc.",
-            location="San Francisco, CA",
-            description="We're looking for a senior software engineer...",
-            url="https://linkedin.com/jobs/view/123",
-            date_posted=datetime.now(),
-            salary_info="$120,000 - $150,000",
-            job_type="full-time",
-            requirements=["Python", "AWS", "5+ years experience"],
-            is_remote=True,
-            raw_data={"original_data": "would be here"}
-        )
-        mock_results.append(mock_job)
-        
-        return mock_results[:limit]
-    
-    def get_job_details(self, job_id: str) -> JobPosting:
+        # In a real implementation, this would make an API call or scrape
+        # the website. For now, return the shared mock posting.
+        return [_LINKEDIN_MOCK][:limit]
+
+    def get_job_details(self, job_id: str,
+                        _now: Optional[datetime] = None) -> JobPosting:
         """Get detailed information about a specific LinkedIn job."""
-        # In a real implementation, this would make an API call or scrape the job page
-        # For now, return a mock job posting
-        return JobPosting(
+        # In a real implementation, this would make an API call or scrape
+        # the job page. Patch just the per-job fields of the shared mock.
+        return replace(
+            _LINKEDIN_MOCK,
             id=job_id,
-            title="Senior Software Engineer",
-            company="Tech Company Inc.",
-            location="San Francisco, CA",
-            description="Detailed job description with requirements...",
             url=f"https://linkedin.com/jobs/view/{job_id}",
-            date_posted=datetime.now(),
-            salary_info="$120,000 - $150,000",
-            job_type="full-time",
-            requirements=["Python", "AWS", "5+ years experience"],
-            is_remote=True,
-            raw_data={"original_data": "would be here"}
+            description="Detailed job description with requirements...",
+            date_posted=_now or _LINKEDIN_MOCK.date_posted,
         )
     
     def is_rate_limited(self) -> bool:
@@ -180,8 +308,8 @@ class IndeedJobBoard(JobBoardInterface):
         """
         self._api_key = api_key
         self._rate_limited = False
-        self._last_request_time = None
-        self._min_request_interval = 1.5  # seconds between requests
+        self._last_request_ns = 0
+        self._min_interval_ns = int(1.5 * 1e9)  # nanoseconds between requests
     
     @property
     def name(self) -> str:
@@ -203,42 +331,18 @@ class IndeedJobBoard(JobBoardInterface):
         would use the Indeed API or web scraping.
         """
         # Mock implementation for testing
-        mock_results = []
-        
-        mock_job = JobPosting(
-            id="indeed-job-456",
-            title="Python Developer",
-            company="Software Solutions LLC",
-            location="New York, NY",
-            description="Looking for a Python developer with web experience...",
-            url="https://indeed.com/jobs/view/456",
-            date_posted=datetime.now(),
-            salary_info="$90,000 - $110,000",
-            job_type="full-time",
-            requirements=["Python", "Django", "3+ years experience"],
-            is_remote=False,
-            raw_data={"original_data": "would be here"}
-        )
-        mock_results.append(mock_job)
-        
-        return mock_results[:limit]
-    
-    def get_job_details(self, job_id: str) -> JobPosting:
+        return [_INDEED_MOCK][:limit]
+
+    def get_job_details(self, job_id: str,
+                        _now: Optional[datetime] = None) -> JobPosting:
         """Get detailed information about a specific Indeed job."""
         # Mock implementation for testing
-        return JobPosting(
+        return replace(
+            _INDEED_MOCK,
             id=job_id,
-            title="Python Developer",
-            company="Software Solutions LLC",
-            location="New York, NY",
-            description="Detailed job description for Python developer role...",
             url=f"https://indeed.com/jobs/view/{job_id}",
-            date_posted=datetime.now(),
-            salary_info="$90,000 - $110,000",
-            job_type="full-time",
-            requirements=["Python", "Django", "3+ years experience"],
-            is_remote=False,
-            raw_data={"original_data": "would be here"}
+            description="Detailed job description for Python developer role...",
+            date_posted=_now or _INDEED_MOCK.date_posted,
         )
     
     def is_rate_limited(self) -> bool:
@@ -258,8 +362,8 @@ class GlassdoorJobBoard(JobBoardInterface):
         """
         self._api_key = api_key
         self._rate_limited = False
-        self._last_request_time = None
-        self._min_request_interval = 2.0  # seconds between requests
+        self._last_request_ns = 0
+        self._min_interval_ns = int(2.0 * 1e9)  # nanoseconds between requests
     
     @property
     def name(self) -> str:
@@ -281,42 +385,18 @@ class GlassdoorJobBoard(JobBoardInterface):
         would use the Glassdoor API or web scraping.
         """
         # Mock implementation for testing
-        mock_results = []
-        
-        mock_job = JobPosting(
-            id="glassdoor-job-789",
-            title="Frontend Developer",
-            company="WebUI Technologies",
-            location="Austin, TX",
-            description="Seeking a skilled frontend developer...",
-            url="https://glassdoor.com/jobs/view/789",
-            date_posted=datetime.now(),
-            salary_info="$85,000 - $105,000",
-            job_type="full-time",
-            requirements=["JavaScript", "React", "2+ years experience"],
-            is_remote=True,
-            raw_data={"original_data": "would be here"}
-        )
-        mock_results.append(mock_job)
-        
-        return mock_results[:limit]
-    
-    def get_job_details(self, job_id: str) -> JobPosting:
+        return [_GLASSDOOR_MOCK][:limit]
+
+    def get_job_details(self, job_id: str,
+                        _now: Optional[datetime] = None) -> JobPosting:
         """Get detailed information about a specific Glassdoor job."""
         # Mock implementation for testing
-        return JobPosting(
+        return replace(
+            _GLASSDOOR_MOCK,
             id=job_id,
-            title="Frontend Developer",
-            company="WebUI Technologies",
-            location="Austin, TX",
-            description="Detailed job description for frontend developer role...",
             url=f"https://glassdoor.com/jobs/view/{job_id}",
-            date_posted=datetime.now(),
-            salary_info="$85,000 - $105,000",
-            job_type="full-time",
-            requirements=["JavaScript", "React", "2+ years experience"],
-            is_remote=True,
-            raw_data={"original_data": "would be here"}
+            description="Detailed job description for frontend developer role...",
+            date_posted=_now or _GLASSDOOR_MOCK.date_posted,
         )
     
     def is_rate_limited(self) -> bool:
@@ -324,31 +404,92 @@ class GlassdoorJobBoard(JobBoardInterface):
         return self._rate_limited
 
 
+class MultiBoardSearcher:
+    """Fans a search out across several job boards concurrently.
+
+    Querying boards sequentially serializes their network waits; gathering
+    the per-board coroutines makes the wall-clock cost roughly the slowest
+    board instead of the sum of all of them.
+    """
+
+    def __init__(self, boards: List[JobBoardInterface]):
+        """
+        Initialize the searcher.
+
+        Args:
+            boards: Job board instances to query on each search
+        """
+        self.boards = list(boards)
+
+    async def search_async(self, keywords: List[str], **kwargs) -> List[JobPosting]:
+        """
+        Search all boards concurrently and combine their results.
+
+        Takes the same keyword arguments as JobBoardInterface.search().
+        A board that raises is skipped rather than failing the whole
+        search.
+
+        Returns:
+            List of JobPosting objects from all boards that succeeded
+        """
+        results = await asyncio.gather(
+            *(board.search_async(keywords, **kwargs) for board in self.boards),
+            return_exceptions=True,
+        )
+        postings: List[JobPosting] = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                postings.extend(result)
+        return postings
+
+    def search(self, keywords: List[str], **kwargs) -> List[JobPosting]:
+        """Synchronous wrapper around search_async() for non-async callers."""
+        return asyncio.run(self.search_async(keywords, **kwargs))
+
+
+# Registry of known job boards; new boards can be added here (or by
+# plug-ins at runtime) without editing the factory itself. Keys are
+# interned so lookups with an interned probe resolve on pointer equality
+# alone, without a character-by-character compare.
+_REGISTRY = {
+    sys.intern("linkedin"): LinkedInJobBoard,
+    sys.intern("indeed"): IndeedJobBoard,
+    sys.intern("glassdoor"): GlassdoorJobBoard,
+}
+
+
 class JobBoardFactory:
     """Factory class to create job board instances."""
-    
-    @staticmethod
-    def create(board_name: str, api_key: Optional[str] = None) -> JobBoardInterface:
+
+    # Cache of instances keyed by (board name, api key). Boards hold
+    # rate-limit state, so callers sharing a board/key pair share one
+    # instance and its request accounting.
+    _instances: Dict[tuple, JobBoardInterface] = {}
+
+    @classmethod
+    def create(cls, board_name: str, api_key: Optional[str] = None) -> JobBoardInterface:
         """
-        Create a job board instance by name.
-        
+        Create (or reuse) a job board instance by name.
+
+        Instances are cached per (board_name, api_key), so repeated calls
+        return the same object and its rate-limit state is shared.
+
         Args:
             board_name: Name of the job board ("linkedin", "indeed", "glassdoor")
             api_key: Optional API key for the job board
-            
+
         Returns:
             A JobBoardInterface implementation
-            
+
         Raises:
             ValueError: If the board name is not recognized
         """
-        board_name = board_name.lower()
-        
-        if board_name == "linkedin":
-            return LinkedInJobBoard(api_key)
-        elif board_name == "indeed":
-            return IndeedJobBoard(api_key)
-        elif board_name == "glassdoor":
-            return GlassdoorJobBoard(api_key)
-        else:
-            raise ValueError(f"Unknown job board: {board_name}")
\ No newline at end of file
+        board_name = sys.intern(board_name.lower())
+        key = (board_name, api_key)
+        board = cls._instances.get(key)
+        if board is None:
+            board_class = _REGISTRY.get(board_name)
+            if board_class is None:
+                raise ValueError(f"Unknown job board: {board_name}")
+            board = cls._instances[key] = board_class(api_key)
+        return board
\ No newline at end of file